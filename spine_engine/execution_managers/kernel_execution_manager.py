@@ -18,6 +18,7 @@ Contains the KernelExecutionManager class and subclasses, and some convenience f
 import os
 import sys
 import subprocess
+import threading
 import uuid
 from jupyter_client.manager import KernelManager
 from jupyter_client.kernelspec import NoSuchKernel
@@ -54,6 +55,8 @@ class _KernelManagerFactory(metaclass=Singleton):
     """Maps filter_id (str) to associated KernelManager"""
     _key_by_connection_file = {}
     """Maps connection file path to filter_id (str)"""
+    _lock = threading.RLock()
+    """Guards modifications and scans of the above dicts; key lookups are lock-free"""
 
     def _make_kernel_manager(self, kernel_name, group_id, server_ip, filter_id):
         """Creates a new kernel manager if necessary or returns an existing one.
@@ -69,16 +72,17 @@ class _KernelManagerFactory(metaclass=Singleton):
         """
         if not filter_id == "":
             group_id = filter_id  # Ignore group ID in case filter ID exists
-        for k in self._kernel_managers:
-            # Reuse kernel manager if using same group id and kernel and it's idle
-            km = self._kernel_managers[k]
-            if km.group_id() == group_id and km.kernel_name == kernel_name:
-                if not km.is_busy():
+        with self._lock:
+            for km in self._kernel_managers.values():
+                # Reuse kernel manager if using same group id and kernel and it's idle
+                if km.group_id() == group_id and km.kernel_name == kernel_name and not km.is_busy():
                     return km
-        key = uuid.uuid4().hex
-        # Spawn a new kernel manager
-        km = self._kernel_managers[key] = GroupedKernelManager(kernel_name=kernel_name, ip=server_ip, group_id=group_id)
-        return km
+            key = uuid.uuid4().hex
+            # Spawn a new kernel manager
+            km = self._kernel_managers[key] = GroupedKernelManager(
+                kernel_name=kernel_name, ip=server_ip, group_id=group_id
+            )
+            return km
 
     def new_kernel_manager(self, kernel_name, group_id, logger, extra_switches=None, environment="", **kwargs):
         """Creates a new kernel manager for given kernel and group id if none exists.
@@ -102,7 +106,7 @@ class _KernelManagerFactory(metaclass=Singleton):
         if environment == "conda":
             if not os.path.exists(conda_exe):
                 logger.msg_kernel_execution.emit(msg=dict(type="conda_not_found"))
-                self._kernel_managers.pop(self.get_kernel_manager_key(km))
+                self._discard_kernel_manager(km)
                 return None
             km.kernel_spec_manager = CondaKernelSpecManager(conda_exe=conda_exe)
         msg = dict(kernel_name=kernel_name)
@@ -113,12 +117,12 @@ class _KernelManagerFactory(metaclass=Singleton):
                     # i.e. the conda environment does not exist
                     msg["type"] = "conda_kernel_spec_not_found"
                     logger.msg_kernel_execution.emit(msg)
-                    self._kernel_managers.pop(self.get_kernel_manager_key(km))  # Delete failed kernel manager
+                    self._discard_kernel_manager(km)  # Delete failed kernel manager
                     return None
             except NoSuchKernel:
                 msg["type"] = "kernel_spec_not_found"
                 logger.msg_kernel_execution.emit(msg)
-                self._kernel_managers.pop(self.get_kernel_manager_key(km))
+                self._discard_kernel_manager(km)
                 return None
             # Check that kernel spec executable is referring to a file that actually exists
             exe_path = km.kernel_spec.argv[0]
@@ -126,21 +130,31 @@ class _KernelManagerFactory(metaclass=Singleton):
                 msg["type"] = "kernel_spec_exe_not_found"
                 msg["kernel_exe_path"] = exe_path
                 logger.msg_kernel_execution.emit(msg)
-                self._kernel_managers.pop(self.get_kernel_manager_key(km))
+                self._discard_kernel_manager(km)
                 return None
             if extra_switches:
                 # Insert switches right after the julia program
                 km.kernel_spec.argv[1:1] = extra_switches
             km.start_kernel(**kwargs)
-            key = self.get_kernel_manager_key(km)
-            if not key:
-                return None  # Logic error
-            self._key_by_connection_file[km.connection_file] = key
+            with self._lock:
+                key = self.get_kernel_manager_key(km)
+                if not key:
+                    return None  # Logic error
+                self._key_by_connection_file[km.connection_file] = key
         msg["type"] = "kernel_started"
         msg["connection_file"] = km.connection_file
         logger.msg_kernel_execution.emit(msg)
         return km
 
+    def _discard_kernel_manager(self, km):
+        """Removes given kernel manager from the factory.
+
+        Args:
+            km (GroupedKernelManager): Kernel manager
+        """
+        with self._lock:
+            self._kernel_managers.pop(self.get_kernel_manager_key(km), None)
+
     def get_kernel_manager_key(self, km):
         """Returns the key of the given kernel manager stored in this factory.
 
@@ -150,9 +164,10 @@ class _KernelManagerFactory(metaclass=Singleton):
         Returns:
             str: Kernel Manager's 32 character key
         """
-        for key, kernman in self._kernel_managers.items():
-            if kernman == km:
-                return key
+        with self._lock:
+            for key, kernman in self._kernel_managers.items():
+                if kernman == km:
+                    return key
         return None
 
     def get_kernel_manager(self, connection_file):
@@ -177,8 +192,9 @@ class _KernelManagerFactory(metaclass=Singleton):
         Returns:
             GroupedKernelManager or None
         """
-        key = self._key_by_connection_file.pop(connection_file, None)
-        return self._kernel_managers.pop(key, None)
+        with self._lock:
+            key = self._key_by_connection_file.pop(connection_file, None)
+            return self._kernel_managers.pop(key, None)
 
     def shutdown_kernel_manager(self, connection_file):
         """Pops a kernel manager from factory and shuts it down.
@@ -216,14 +232,13 @@ class _KernelManagerFactory(metaclass=Singleton):
 
     def kill_kernel_managers(self):
         """Shuts down all kernel managers stored in the factory."""
-        while True:
-            try:
-                key, km = self._kernel_managers.popitem()
-                if km.is_alive():
-                    km.shutdown_kernel(now=True)
-            except KeyError:
-                break
-        self._key_by_connection_file.clear()
+        with self._lock:
+            kernel_managers = list(self._kernel_managers.values())
+            self._kernel_managers.clear()
+            self._key_by_connection_file.clear()
+        for km in kernel_managers:
+            if km.is_alive():
+                km.shutdown_kernel(now=True)
 
     def n_kernel_managers(self):
         """Returns the number of open kernel managers stored in the factory."""
@@ -283,11 +298,10 @@ class KernelExecutionManager(ExecutionManagerBase):
             **kwargs (optional): Keyword arguments passed to ``KernelManager.start_kernel()``
         """
         super().__init__(logger)
-        self._msg_head = dict(kernel_name=kernel_name)
+        self._kernel_name = kernel_name
         self._commands = commands
         self._cmd_failed = False
-        self.std_out = kwargs["stdout"] = open(os.devnull, "w")
-        self.std_err = kwargs["stderr"] = open(os.devnull, "w")
+        kwargs["stdout"] = kwargs["stderr"] = subprocess.DEVNULL
         # Don't show console when frozen
         kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
         self._kernel_manager = _kernel_manager_factory.new_kernel_manager(
@@ -306,7 +320,7 @@ class KernelExecutionManager(ExecutionManagerBase):
         if self._kill_completed:
             conn_file = self._kernel_manager.connection_file
             shutdown_kernel_manager(conn_file)
-            self._logger.msg_kernel_execution.emit(dict(type="kernel_shutdown", **self._msg_head))
+            self._logger.msg_kernel_execution.emit({"type": "kernel_shutdown", "kernel_name": self._kernel_name})
         if self._cmd_failed or not run_succeeded:
             return -1
         return 0
@@ -315,12 +329,12 @@ class KernelExecutionManager(ExecutionManagerBase):
         try:
             self._kernel_client.wait_for_ready(timeout=self._startup_timeout)
         except RuntimeError as e:
-            msg = dict(type="execution_failed_to_start", error=str(e), **self._msg_head)
+            msg = {"type": "execution_failed_to_start", "error": str(e), "kernel_name": self._kernel_name}
             self._logger.msg_kernel_execution.emit(msg)
             self._kernel_client.stop_channels()
             self._kernel_manager.shutdown_kernel(now=True)
             return False
-        msg = dict(type="execution_started", **self._msg_head)
+        msg = {"type": "execution_started", "kernel_name": self._kernel_name}
         self._logger.msg_kernel_execution.emit(msg)
         for cmd in self._commands:
             self._cmd_failed = False
@@ -357,4 +371,4 @@ class KernelExecutionManager(ExecutionManagerBase):
             if self._kill_completed:
                 conn_file = self._kernel_manager.connection_file
                 shutdown_kernel_manager(conn_file)
-                self._logger.msg_kernel_execution.emit(dict(type="kernel_shutdown", **self._msg_head))
+                self._logger.msg_kernel_execution.emit({"type": "kernel_shutdown", "kernel_name": self._kernel_name})
@@ -10,7 +10,7 @@
 # this program. If not, see <http://www.gnu.org/licenses/>.
 ######################################################################################################################
 """ Provides connection classes for linking project items. """
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 import os
 import subprocess
 import tempfile
@@ -42,6 +42,8 @@ SUPPORTED_FILTER_TYPES = {ALTERNATIVE_FILTER_TYPE, SCENARIO_FILTER_TYPE}
 class ConnectionBase:
     """Base class for connections between two project items."""
 
+    __slots__ = ("source", "_source_position", "destination", "_destination_position", "_logger")
+
     def __init__(self, source_name, source_position, destination_name, destination_position):
         """
         Args:
@@ -57,6 +59,8 @@ class ConnectionBase:
         self._logger = None
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, ConnectionBase):
             return NotImplemented
         return (
@@ -170,7 +174,10 @@ DEFAULT_ENABLED_FILTER_TYPES = {ALTERNATIVE_FILTER_TYPE: False, SCENARIO_FILTER_
 
 @dataclass
 class FilterSettings:
-    """Filter settings for resource converting connections."""
+    """Filter settings for resource converting connections.
+
+    Note: __eq__ is maintained by hand instead of generated by dataclass; it must compare every field.
+    """
 
     known_filters: dict = field(default_factory=dict)
     """mapping from resource labels and filter types to filter online statuses"""
@@ -188,17 +195,29 @@ class FilterSettings:
             if supported_filters:
                 self.known_filters[resource] = supported_filters
 
+    def __eq__(self, other):
+        if other is self:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.auto_online == other.auto_online
+            and self.enabled_filter_types == other.enabled_filter_types
+            and self.known_filters == other.known_filters
+        )
+
     def has_filters(self):
         """Tests if there are filters.
 
         Returns:
             bool: True if filters of any type exists, False otherwise
         """
-        for filters_by_type in self.known_filters.values():
-            for filter_type, filters in filters_by_type.items():
-                if self.enabled_filter_types[filter_type] and filters:
-                    return True
-        return False
+        enabled_filter_types = self.enabled_filter_types
+        return any(
+            enabled_filter_types[filter_type] and filters
+            for filters_by_type in self.known_filters.values()
+            for filter_type, filters in filters_by_type.items()
+        )
 
     def has_any_filter_online(self):
         """Tests in any filter is online.
@@ -206,11 +225,12 @@ class FilterSettings:
         Returns:
             bool: True if any filter is online, False otherwise
         """
-        for filters_by_type in self.known_filters.values():
-            for filter_type, filters in filters_by_type.items():
-                if self.enabled_filter_types[filter_type] and any(filters.values()):
-                    return True
-        return False
+        enabled_filter_types = self.enabled_filter_types
+        return any(
+            enabled_filter_types[filter_type] and any(filters.values())
+            for filters_by_type in self.known_filters.values()
+            for filter_type, filters in filters_by_type.items()
+        )
 
     def has_filter_online(self, filter_type):
         """Tests if any filter of given type is online.
@@ -223,10 +243,11 @@ class FilterSettings:
         """
         if not self.enabled_filter_types[filter_type]:
             return False
-        for filters_by_type in self.known_filters.values():
-            if any(filters_by_type.get(filter_type, {}).values()):
-                return True
-        return False
+        return any(
+            any(filters_by_type[filter_type].values())
+            for filters_by_type in self.known_filters.values()
+            if filter_type in filters_by_type
+        )
 
     def to_dict(self):
         """Stores the settings to a dict.
@@ -234,7 +255,14 @@ class FilterSettings:
         Returns:
             dict: serialized settings
         """
-        return asdict(self)
+        return {
+            "known_filters": {
+                label: {filter_type: filters.copy() for filter_type, filters in filters_by_type.items()}
+                for label, filters_by_type in self.known_filters.items()
+            },
+            "auto_online": self.auto_online,
+            "enabled_filter_types": self.enabled_filter_types.copy(),
+        }
 
     @staticmethod
     def from_dict(settings_dict):
@@ -250,6 +278,8 @@ class FilterSettings:
 
 
 class ResourceConvertingConnection(ConnectionBase):
+    __slots__ = ("_filter_settings", "options", "_resources")
+
     def __init__(
         self, source_name, source_position, destination_name, destination_position, options=None, filter_settings=None
     ):
@@ -268,6 +298,8 @@ class ResourceConvertingConnection(ConnectionBase):
         self._resources = set()
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if not isinstance(other, ResourceConvertingConnection):
             return NotImplemented
         return (
@@ -398,23 +430,18 @@ class ResourceConvertingConnection(ConnectionBase):
     def _apply_use_memory_db(self, resources):
         if not self.use_memory_db:
             return resources
-        final_resources = []
-        for r in resources:
-            if r.type_ == "database":
-                r = r.clone(additional_metadata={"memory": True})
-            final_resources.append(r)
-        return final_resources
+        return [r.clone(additional_metadata={"memory": True}) if r.type_ == "database" else r for r in resources]
 
     def _apply_write_index(self, resources, sibling_connections):
-        final_resources = []
-        precursors = set(c.name for c in sibling_connections if c.write_index < self.write_index)
-        for r in resources:
-            if r.type_ == "database":
-                r = r.clone(
-                    additional_metadata={"current": self.name, "precursors": precursors, "part_count": PartCount()}
-                )
-            final_resources.append(r)
-        return final_resources
+        name = self.name
+        write_index = self.write_index
+        precursors = set(c.name for c in sibling_connections if c.write_index < write_index)
+        return [
+            r.clone(additional_metadata={"current": name, "precursors": precursors, "part_count": PartCount()})
+            if r.type_ == "database"
+            else r
+            for r in resources
+        ]
 
     def _apply_use_datapackage(self, resources):
         if not self.use_datapackage:
@@ -423,7 +450,7 @@ class ResourceConvertingConnection(ConnectionBase):
         final_resources = []
         csv_filepaths = []
         for r in resources:
-            if r.hasfilepath and os.path.splitext(r.path)[1].lower() == ".csv":
+            if r.hasfilepath and r.path.lower().endswith(".csv"):
                 csv_filepaths.append(r.path)
                 continue
             final_resources.append(r)
@@ -480,6 +507,8 @@ class ResourceConvertingConnection(ConnectionBase):
 class Connection(ResourceConvertingConnection):
     """Represents a connection between two project items."""
 
+    __slots__ = ("_enabled_filter_values", "_source_visited")
+
     def __init__(
         self, source_name, source_position, destination_name, destination_position, options=None, filter_settings=None
     ):
@@ -594,6 +623,18 @@ class Connection(ResourceConvertingConnection):
 class Jump(ConnectionBase):
     """Represents a conditional jump between two project items."""
 
+    __slots__ = (
+        "condition",
+        "_resources_from_source",
+        "_resources_from_destination",
+        "cmd_line_args",
+        "_engine",
+        "source_solid",
+        "destination_solid",
+        "item_names",
+        "solid_names",
+    )
+
     def __init__(
         self, source_name, source_position, destination_name, destination_position, condition={}, cmd_line_args=()
     ):
@@ -732,10 +773,11 @@ def _restore_legacy_disabled_filters(disabled_filter_names):
         dict: known filters
     """
     deprecated_types = {"tool_filter"}
-    converted = {}
-    for label, names_by_type in disabled_filter_names.items():
-        converted_names_by_type = converted.setdefault(label, {})
-        for filter_type, names in names_by_type.items():
-            if filter_type not in deprecated_types:
-                converted_names_by_type[filter_type] = {name: False for name in names}
-    return converted
+    return {
+        label: {
+            filter_type: dict.fromkeys(names, False)
+            for filter_type, names in names_by_type.items()
+            if filter_type not in deprecated_types
+        }
+        for label, names_by_type in disabled_filter_names.items()
+    }
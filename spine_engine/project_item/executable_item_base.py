@@ -32,14 +32,14 @@ class ExecutableItemBase:
         self._name = name
         self._project_dir = project_dir
         data_dir = Path(self._project_dir, ".spinetoolbox", "items", shorten(name))
-        data_dir.mkdir(parents=True, exist_ok=True)
-        self._data_dir = str(data_dir)
-        logs_dir = Path(self._data_dir, "logs")
+        logs_dir = data_dir / "logs"
         logs_dir.mkdir(parents=True, exist_ok=True)
+        self._data_dir = str(data_dir)
         self._logs_dir = str(logs_dir)
         self._logger = logger
         self._group_id = name if group_id is None else group_id
         self._filter_id = ""
+        self._filter_id_hash = ""
 
     @property
     def name(self):
@@ -68,11 +68,14 @@ class ExecutableItemBase:
         Returns:
             str: hash
         """
-        return sha1(bytes(self._filter_id, "utf8")).hexdigest() if self._filter_id else ""
+        if self._filter_id and not self._filter_id_hash:
+            self._filter_id_hash = sha1(bytes(self._filter_id, "utf8")).hexdigest()
+        return self._filter_id_hash
 
     @filter_id.setter
     def filter_id(self, filter_id):
         self._filter_id = filter_id
+        self._filter_id_hash = ""
         self._logger.set_filter_id(filter_id)
 
     @property
@@ -170,10 +173,11 @@ class ExecutableItemBase:
         Returns:
             list: a list of ProjectItemResources
         """
-        return {
-            ExecutionDirection.BACKWARD: self._output_resources_backward,
-            ExecutionDirection.FORWARD: self._output_resources_forward,
-        }[direction]()
+        if direction is ExecutionDirection.FORWARD:
+            return self._output_resources_forward()
+        if direction is ExecutionDirection.BACKWARD:
+            return self._output_resources_backward()
+        raise ValueError(f"Unknown execution direction '{direction}'")
 
     def stop_execution(self):
         """Stops executing this item."""
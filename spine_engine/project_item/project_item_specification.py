@@ -69,8 +69,9 @@ class ProjectItemSpecification:
         definition = self.to_dict()
         local_entries = self._definition_local_entries()
         popped = gather_leaf_data(definition, local_entries, pop=True)
+        serialized = json.dumps(definition, indent=4)
         with open(self.definition_file_path, "w") as fp:
-            json.dump(definition, fp, indent=4)
+            fp.write(serialized)
         return popped
 
     def to_dict(self):
@@ -88,7 +89,10 @@ class ProjectItemSpecification:
         Returns:
             dict: local data
         """
-        return gather_leaf_data(self.to_dict(), self._definition_local_entries())
+        local_entries = self._definition_local_entries()
+        if not local_entries:
+            return {}
+        return gather_leaf_data(self.to_dict(), local_entries)
 
     def may_have_local_data(self):
         """Tests if specification could have project specific local data.
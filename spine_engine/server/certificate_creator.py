@@ -44,14 +44,15 @@ class CertificateCreator:
         # create new keys in certificates dir
         server_public_file, server_secret_file = zmq.auth.create_certificates(keys_dir, "server")
         client_public_file, client_secret_file = zmq.auth.create_certificates(keys_dir, "client")
-        # move public keys to appropriate directory
-        for key_file in os.listdir(keys_dir):
-            if key_file.endswith(".key"):
-                shutil.move(os.path.join(keys_dir, key_file), os.path.join(public_keys_dir, "."))
-        # move secret keys to appropriate directory
-        for key_file in os.listdir(keys_dir):
-            if key_file.endswith(".key_secret"):
-                shutil.move(os.path.join(keys_dir, key_file), os.path.join(secret_keys_dir, "."))
+        # move public and secret keys to appropriate directories
+        # All directories live under base_dir, so a plain rename is enough
+        with os.scandir(keys_dir) as scanned:
+            entries = list(scanned)
+        for entry in entries:
+            if entry.name.endswith(".key"):
+                os.replace(entry.path, os.path.join(public_keys_dir, entry.name))
+            elif entry.name.endswith(".key_secret"):
+                os.replace(entry.path, os.path.join(secret_keys_dir, entry.name))
 
 
 def main(args):
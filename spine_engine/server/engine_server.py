@@ -298,9 +298,7 @@ class EngineServer(threading.Thread):
             connection_id (bytes): Client Id. Assigned by the frontend ROUTER socket when a request is received.
             error_msg (str): Error message to client
         """
-        error_msg_tuple = ("server_init_failed", error_msg)
-        err_msg_as_json = json.dumps(error_msg_tuple)
-        reply_msg = ServerMessage("", "", err_msg_as_json, [])
+        reply_msg = ServerMessage("", "", ("server_init_failed", error_msg), [])
         frame = [connection_id, b"", reply_msg.to_bytes()]
         socket.send_multipart(frame)
         print("\nClient has been notified. Moving on...")
@@ -85,8 +85,10 @@ class Request:
             internal_msg (tuple): Internal server message, [job_id, msg]
             dump_to_json (bool): If True, info is dumped to a JSON str. When False, info must be a JSON str already.
         """
-        info_as_json = json.dumps(info) if dump_to_json else info
-        reply_msg = ServerMessage(self._cmd, self._request_id, info_as_json, [])
+        if dump_to_json and isinstance(info, str):
+            # ServerMessage embeds strings as they are
+            info = json.dumps(info)
+        reply_msg = ServerMessage(self._cmd, self._request_id, info, [])
         if not internal_msg:
             self.send_multipart_reply(socket, self.connection_id(), reply_msg.to_bytes())
         else:
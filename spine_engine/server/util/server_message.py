@@ -20,7 +20,9 @@ import json
 class ServerMessage:
     """Class for communicating requests and replies between the client and the server."""
 
-    def __init__(self, command, req_id, data, files=None):
+    __slots__ = ("_command", "_id", "_data", "_data_is_json", "_files")
+
+    def __init__(self, command, req_id, data, files=None, *, data_is_json=None):
         """
         Supported requests and expected server responses
         - Ping
@@ -39,13 +41,16 @@ class ServerMessage:
         Args:
             command (str): Command to be executed at the server
             req_id (str): Identifier associated with the command
-            data (str): Data associated to the command. In an execute request, this is the engine
+            data (str or object): Data associated to the command. In an execute request, this is the engine
             data as a JSON string. In an execute reply, this is an event_type:data (str:str) tuple.
             files (list[str], None): List of file names to be associated with the message (optional)
+            data_is_json (bool, optional): If True, data is a JSON string that is embedded into the message as is;
+                otherwise data is serialized to JSON. Defaults to True for str data and False for anything else.
         """
         self._command = command
         self._id = req_id
         self._data = data
+        self._data_is_json = isinstance(data, str) if data_is_json is None else data_is_json
         if not files:
             self._files = list()
         else:
@@ -69,34 +74,17 @@ class ServerMessage:
         Returns:
             str: The instance as a JSON string
         """
-        jsonFileNames = self._getJSONFileNames()
-        retStr = ""
-        retStr += "{\n"
-        retStr += '   "command": "' + self._command + '",\n'
-        retStr += '   "id":"' + self._id + '",\n'
-
-        if len(self._data) == 0:
-            retStr += '   "data":"",\n'
+        if self._data_is_json:
+            data = self._data if self._data else '""'
         else:
-            retStr += '   "data":' + self._data + ",\n"
-        retStr += '   "files": ' + jsonFileNames
-        retStr += "}"
-        return retStr
+            data = json.dumps(self._data)
+        return (
+            f'{{"command": {json.dumps(self._command)}, "id": {json.dumps(self._id)}, '
+            f'"data": {data}, "files": {self._getJSONFileNames()}}}'
+        )
 
     def _getJSONFileNames(self):
-        fileNameCount = len(self._files)
-        if fileNameCount == 0:
-            return "{}\n"
-        retStr = "{\n"
-        i = 0
-        for fName in self._files:
-            if i + 1 < fileNameCount:
-                retStr = retStr + '    "name-' + str(i) + '": "' + fName + '",\n'
-            else:
-                retStr = retStr + '    "name-' + str(i) + '": "' + fName + '"\n'
-            i += 1
-        retStr = retStr + "    }\n"
-        return retStr
+        return json.dumps({f"name-{i}": file_name for i, file_name in enumerate(self._files)})
 
     def to_bytes(self):
         """Converts this ServerMessage instance to a JSON and then to a bytes string.
@@ -124,7 +112,7 @@ class ServerMessage:
         if len(filenames) > 0:
             for f in filenames:
                 parsed_filenames.append(filenames[f])
-            msg = cls(parsed_msg["command"], parsed_msg["id"], data, parsed_filenames)
+            msg = cls(parsed_msg["command"], parsed_msg["id"], data, parsed_filenames, data_is_json=False)
         else:
-            msg = cls(parsed_msg["command"], parsed_msg["id"], data, None)
+            msg = cls(parsed_msg["command"], parsed_msg["id"], data, None, data_is_json=False)
         return msg
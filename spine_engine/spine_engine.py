@@ -14,7 +14,7 @@ from enum import Enum, unique
 import os
 import threading
 import multiprocessing as mp
-from itertools import product
+from itertools import chain, product
 import networkx as nx
 from dagster import (
     PipelineDefinition,
@@ -43,7 +43,6 @@ from .execution_managers.persistent_execution_manager import (
 from .utils.helpers import (
     AppSettings,
     required_items_for_execution,
-    inverted,
     create_timestamp,
     make_dag,
     ExecutionDirection as ED,
@@ -69,7 +68,7 @@ class SpineEngineState(Enum):
     COMPLETED = 5
 
     def __str__(self):
-        return str(self.name)
+        return self.name
 
 
 class _JumpPipelineDefinition(PipelineDefinition):
@@ -148,20 +147,31 @@ class SpineEngine:
         if jumps is None:
             jumps = []
         self._jumps = list(map(Jump.from_dict, jumps))
-        validate_jumps(self._jumps, self._dag)
+        self._items_by_jump = _get_items_by_jump(self._jumps, self._dag)
+        validate_jumps(self._jumps, self._dag, self._items_by_jump)
         for x in self._connections + self._jumps:
             x.make_logger(self._queue)
         for x in self._jumps:
             x.set_engine(self)
         # Mapping of item name to solid name
-        self._solids_by_items = {item_name: str(i) for i, item_name in enumerate(self._dag_nodes)}
+        self._solids_by_items = {}
         # Mapping of solid name to item name
-        self._items_by_solids = {solid_name: item_name for item_name, solid_name in self._solids_by_items.items()}
+        self._items_by_solids = {}
+        for i, item_name in enumerate(self._dag_nodes):
+            solid_name = str(i)
+            self._solids_by_items[item_name] = solid_name
+            self._items_by_solids[solid_name] = item_name
         # Same as edges but item names are swapped to solid names
-        self._back_injectors = {
-            self._solids_by_items[key]: [self._solids_by_items[x] for x in value] for key, value in edges.items()
-        }
-        self._forth_injectors = inverted(self._back_injectors)
+        self._back_injectors = {}
+        # Inverse of the above
+        self._forth_injectors = {}
+        for key, value in edges.items():
+            solid_name = self._solids_by_items[key]
+            injectors = self._back_injectors[solid_name] = []
+            for x in value:
+                injector = self._solids_by_items[x]
+                injectors.append(injector)
+                self._forth_injectors.setdefault(injector, []).append(solid_name)
         self._pipeline = self._make_pipeline()
         self._state = SpineEngineState.SLEEPING
         self._debug = debug
@@ -195,7 +205,7 @@ class SpineEngine:
             descendants = self._descendants(item_name)
             for conn in self._connections_by_source.get(item_name, ()):
                 sibling_connections = [
-                    x for x in self._connections_by_destination.get(conn.destination, []) if x != conn
+                    x for x in self._connections_by_destination.get(conn.destination, []) if x is not conn
                 ]
                 conflicting.update(
                     {
@@ -331,11 +341,12 @@ class SpineEngine:
         Args:
             event (DagsterEvent): an event
         """
-        if event.event_type == DagsterEventType.STEP_START:
+        event_type = event.event_type
+        if event_type is DagsterEventType.STEP_START:
             direction, _, solid_name = event.solid_name.partition("_")
             item_name = self._items_by_solids[solid_name]
             self._queue.put(("exec_started", {"item_name": item_name, "direction": direction}))
-        elif event.event_type == DagsterEventType.STEP_FAILURE and self._state != SpineEngineState.USER_STOPPED:
+        elif event_type is DagsterEventType.STEP_FAILURE and self._state != SpineEngineState.USER_STOPPED:
             direction, _, solid_name = event.solid_name.partition("_")
             item_name = self._items_by_solids[solid_name]
             self._state = SpineEngineState.FAILED
@@ -355,7 +366,7 @@ class SpineEngine:
                 print("Traceback (most recent call last):")
                 print("".join(error.stack + [error.message]))
                 print("(reported by SpineEngine in debug mode)")
-        elif event.event_type == DagsterEventType.STEP_SUCCESS:
+        elif event_type is DagsterEventType.STEP_SUCCESS:
             # Notify Toolbox here when BACKWARD execution has finished
             direction, _, solid_name = event.solid_name.partition("_")
             if direction != "BACKWARD":
@@ -376,7 +387,7 @@ class SpineEngine:
                     },
                 )
             )
-        elif event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        elif event_type is DagsterEventType.ASSET_MATERIALIZATION:
             # Notify Toolbox here when FORWARD execution has finished
             direction, _, solid_name = event.solid_name.partition("_")
             if direction != "FORWARD":
@@ -446,9 +457,7 @@ class SpineEngine:
         """Updates jumps with item and corresponding solid information."""
         for jump in self._jumps:
             src, dst = jump.source, jump.destination
-            jump.item_names = {dst, src}
-            for path in nx.all_simple_paths(self._dag, dst, src):
-                jump.item_names.update(path)
+            jump.item_names = {dst, src} | self._items_by_jump[jump]
             jump.solid_names = {f"{ED.FORWARD}_{self._solids_by_items[n]}" for n in jump.item_names}
             jump.source_solid = f"{ED.FORWARD}_{self._solids_by_items[src]}"
             jump.destination_solid = f"{ED.BACKWARD}_{self._solids_by_items[dst]}"
@@ -492,6 +501,8 @@ class SpineEngine:
         Returns:
             SolidDefinition
         """
+        forward_prefix = str(ED.FORWARD)
+        backward_prefix = str(ED.BACKWARD)
 
         def compute_fn(context, inputs):
             if self.state() == SpineEngineState.USER_STOPPED:
@@ -504,9 +515,9 @@ class SpineEngine:
             forward_resource_stacks = []
             backward_resources = []
             for name, values in inputs.items():
-                if name.startswith(f"{ED.FORWARD}"):
+                if name.startswith(forward_prefix):
                     forward_resource_stacks += values
-                elif name.startswith(f"{ED.BACKWARD}"):
+                elif name.startswith(backward_prefix):
                     backward_resources += values
             item_finish_state, output_resource_stacks = self._execute_item(
                 context, item_name, forward_resource_stacks, backward_resources
@@ -610,7 +621,9 @@ class SpineEngine:
         else:
             item.exclude_execution(filtered_forward_resources, filtered_backward_resources, item_lock)
             item_finish_state = ItemExecutionFinishState.EXCLUDED
-        filter_stack = sum((r.metadata.get("filter_stack", ()) for r in filtered_forward_resources), ())
+        filter_stack = tuple(
+            chain.from_iterable(r.metadata.get("filter_stack", ()) for r in filtered_forward_resources)
+        )
         output_resources = item.output_resources(ED.FORWARD)
         for resource in output_resources:
             resource.metadata["filter_stack"] = filter_stack
@@ -761,7 +774,7 @@ class SpineEngine:
                 continue
             if self._execution_permits[item_name]:
                 c.clean_up_backward_resources(resources_from_destination)
-            sibling_connections = [x for x in self._connections_by_destination.get(c.destination, []) if x != c]
+            sibling_connections = [x for x in self._connections_by_destination.get(c.destination, []) if x is not c]
             resources_by_provider[c.destination] = c.convert_backward_resources(
                 resources_from_destination, sibling_connections
             )
@@ -796,24 +809,19 @@ class SpineEngine:
         Returns:
             dict: a dictionary to pass to the PipelineDefinition constructor as dependencies
         """
-        forward_deps = {
-            f"{ED.FORWARD}_{n}": {
-                f"{ED.FORWARD}_input_from_{inj}": DependencyDefinition(f"{ED.FORWARD}_{inj}", f"{ED.FORWARD}_output")
-                for inj in injs
-            }
-            for n, injs in self._forth_injectors.items()
-        }
-        backward_deps = {
-            f"{ED.FORWARD}_{n}": {
-                f"{ED.BACKWARD}_input_from_{inj}": DependencyDefinition(f"{ED.BACKWARD}_{inj}", f"{ED.BACKWARD}_output")
-                for inj in injs
-            }
-            for n, injs in self._back_injectors.items()
-        }
         deps = {}
-        for n in forward_deps.keys() | backward_deps.keys():
-            deps[n] = forward_deps.get(n, {})
-            deps[n].update(backward_deps.get(n, {}))
+        for n, injs in self._forth_injectors.items():
+            solid_deps = deps.setdefault(f"{ED.FORWARD}_{n}", {})
+            for inj in injs:
+                solid_deps[f"{ED.FORWARD}_input_from_{inj}"] = DependencyDefinition(
+                    f"{ED.FORWARD}_{inj}", f"{ED.FORWARD}_output"
+                )
+        for n, injs in self._back_injectors.items():
+            solid_deps = deps.setdefault(f"{ED.FORWARD}_{n}", {})
+            for inj in injs:
+                solid_deps[f"{ED.BACKWARD}_input_from_{inj}"] = DependencyDefinition(
+                    f"{ED.BACKWARD}_{inj}", f"{ED.BACKWARD}_output"
+                )
         return deps
 
 
@@ -866,18 +874,20 @@ def _validate_dag(dag):
     """
     if not nx.is_directed_acyclic_graph(dag):
         raise EngineInitFailed("Invalid DAG")
-    if len(list(nx.weakly_connected_components(dag))) > 1:
+    if dag.number_of_nodes() > 1 and not nx.is_weakly_connected(dag):
         raise EngineInitFailed("DAG contains unconnected items.")
 
 
-def validate_jumps(jumps, dag):
+def validate_jumps(jumps, dag, items_by_jump=None):
     """Raises an exception in case jumps are not valid.
 
     Args:
         jumps (list of Jump): jumps
         dag (DiGraph): jumps' DAG
+        items_by_jump (dict, optional): mapping jumps to a set of items in between destination and source
     """
-    items_by_jump = _get_items_by_jump(jumps, dag)
+    if items_by_jump is None:
+        items_by_jump = _get_items_by_jump(jumps, dag)
     for jump in jumps:
         validate_single_jump(jump, jumps, dag, items_by_jump)
 
@@ -895,12 +905,12 @@ def validate_single_jump(jump, jumps, dag, items_by_jump=None):
         raise EngineInitFailed(f"Jump {jump.name} is not ready for execution.")
     if items_by_jump is None:
         items_by_jump = _get_items_by_jump(jumps, dag)
+    jump_items = items_by_jump[jump]
     for other in jumps:
         if other is jump:
             continue
         if other.source == jump.source:
             raise EngineInitFailed(f"{jump.name} cannot have the same source as {other.name}.")
-        jump_items = items_by_jump[jump]
         other_items = items_by_jump[other]
         intersection = jump_items & other_items
         if intersection not in (set(), jump_items, other_items):
@@ -927,15 +937,28 @@ def _get_items_by_jump(jumps, dag):
     Returns:
         dict
     """
-    items_by_jump = {}
-    for jump in jumps:
-        try:
-            items_by_jump[jump] = {
-                item for path in nx.all_simple_paths(dag, jump.destination, jump.source) for item in path
-            }
-        except nx.NodeNotFound:
-            items_by_jump[jump] = set()
-    return items_by_jump
+    return {jump: _items_between(dag, jump.destination, jump.source) for jump in jumps}
+
+
+def _items_between(dag, first, last):
+    """Returns the items that lie on any path from first to last.
+
+    Args:
+        dag (DiGraph): DAG
+        first (str): name of the item where paths start
+        last (str): name of the item where paths end
+
+    Returns:
+        set of str: items on the paths including first and last, or an empty set if there is no path
+    """
+    if not dag.has_node(first) or not dag.has_node(last):
+        return set()
+    if first == last:
+        return {first}
+    descendants = nx.descendants(dag, first)
+    if last not in descendants:
+        return set()
+    return (descendants & nx.ancestors(dag, last)) | {first, last}
 
 
 def _set_resource_limits(settings, lock):
@@ -12,6 +12,7 @@
 
 """Helper functions and classes."""
 import collections
+import functools
 import os
 import sys
 import datetime
@@ -33,7 +34,7 @@ class ExecutionDirection(Enum):
     NONE = auto()
 
     def __str__(self):
-        return str(self.name)
+        return self.name
 
 
 @unique
@@ -46,7 +47,7 @@ class ItemExecutionFinishState(Enum):
     NEVER_FINISHED = 6
 
     def __str__(self):
-        return str(self.name)
+        return self.name
 
 
 class Singleton(type):
@@ -72,6 +73,7 @@ class AppSettings:
         return self._settings.get(key, defaultValue)
 
 
+@functools.lru_cache(maxsize=4096)
 def shorten(name):
     """Returns the 'short name' version of given name."""
     return name.lower().replace(" ", "_")
@@ -429,11 +431,12 @@ def make_dag(edges, permitted_nodes=None):
         graph.add_nodes_from(nodes)
     else:
         graph.add_nodes_from(edges)
-        for node, successors in edges.items():
-            if successors is None:
-                continue
-            for successor in successors:
-                graph.add_edge(node, successor)
+        graph.add_edges_from(
+            (node, successor)
+            for node, successors in edges.items()
+            if successors is not None
+            for successor in successors
+        )
     return graph
 
 
@@ -34,11 +34,12 @@ class _MessageBase:
         self._filter_id = filter_id
 
     def emit(self, msg):
-        msg = dict(filter_id=self._filter_id, **msg)
-        full_msg = (self._event_type, dict(item_name=self._item_name, **msg))
-        self._queue.put(full_msg)
-        for slot in self._slots:
-            slot(msg)
+        full_msg = {"item_name": self._item_name, "filter_id": self._filter_id, **msg}
+        self._queue.put((self._event_type, full_msg))
+        if self._slots:
+            msg = {"filter_id": self._filter_id, **msg}
+            for slot in self._slots:
+                slot(msg)
 
     def connect(self, slot):
         self._slots.append(slot)
@@ -32,8 +32,6 @@ class TestKernelExecutionManager(unittest.TestCase):
         this to KernelExecutionManager.close() or something."""
         if not mngr._kernel_client.context.closed:
             mngr._kernel_client.context.term()  # ResourceWarning: Unclosed <zmq.Context() happens without this
-        mngr.std_out.close()  # Prevents ResourceWarning: unclosed file <_io.TextIOWrapper name='nul' ...
-        mngr.std_err.close()  # Prevents ResourceWarning: unclosed file <_io.TextIOWrapper name='nul' ...
         return mngr
 
     def test_kernel_execution_manager(self):
@@ -48,6 +48,27 @@ class TestExecutableItem(unittest.TestCase):
         item._output_resources_backward.assert_not_called()
         item._output_resources_forward.assert_called_once_with()
 
+    def test_output_resources_raises_for_invalid_direction(self):
+        item = ExecutableItemBase("name", self._temp_dir.name, mock.MagicMock())
+        item._output_resources_backward = mock.MagicMock()
+        item._output_resources_forward = mock.MagicMock()
+        with self.assertRaises(ValueError):
+            item.output_resources(ExecutionDirection.NONE)
+        item._output_resources_backward.assert_not_called()
+        item._output_resources_forward.assert_not_called()
+
+    def test_hash_filter_id_follows_filter_id(self):
+        item = ExecutableItemBase("name", self._temp_dir.name, mock.MagicMock())
+        self.assertEqual(item.hash_filter_id(), "")
+        item.filter_id = "filter 1"
+        first_hash = item.hash_filter_id()
+        self.assertEqual(len(first_hash), 40)
+        self.assertEqual(item.hash_filter_id(), first_hash)
+        item.filter_id = "filter 2"
+        self.assertNotEqual(item.hash_filter_id(), first_hash)
+        item.filter_id = ""
+        self.assertEqual(item.hash_filter_id(), "")
+
 
 if __name__ == "__main__":
     unittest.main()
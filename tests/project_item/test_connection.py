@@ -17,6 +17,7 @@ from unittest.mock import Mock
 from spinedb_api import DatabaseMapping, import_entity_classes, import_scenarios, import_alternatives
 from spine_engine.project_item.connection import Connection, FilterSettings, Jump
 from spine_engine.project_item.project_item_resource import database_resource
+from spinedb_api.filters.alternative_filter import ALTERNATIVE_FILTER_TYPE
 from spinedb_api.filters.scenario_filter import SCENARIO_FILTER_TYPE
 
 
@@ -235,6 +236,39 @@ class TestFilterSettings(unittest.TestCase):
         )
         self.assertFalse(settings.has_any_filter_online())
 
+    def test_to_dict_makes_copy_of_known_filters(self):
+        settings = FilterSettings({"database@Data Store": {SCENARIO_FILTER_TYPE: {"scenario_1": True}}})
+        settings_dict = settings.to_dict()
+        self.assertEqual(
+            settings_dict,
+            {
+                "known_filters": {"database@Data Store": {SCENARIO_FILTER_TYPE: {"scenario_1": True}}},
+                "auto_online": True,
+                "enabled_filter_types": {ALTERNATIVE_FILTER_TYPE: False, SCENARIO_FILTER_TYPE: True},
+            },
+        )
+        settings_dict["known_filters"]["database@Data Store"][SCENARIO_FILTER_TYPE]["scenario_1"] = False
+        self.assertTrue(settings.known_filters["database@Data Store"][SCENARIO_FILTER_TYPE]["scenario_1"])
+        self.assertEqual(FilterSettings.from_dict(settings.to_dict()), settings)
+
+    def test_eq_compares_all_fields(self):
+        label = "database@Data Store"
+        settings = FilterSettings({label: {SCENARIO_FILTER_TYPE: {"scenario_1": True}}})
+        self.assertEqual(settings, settings)
+        self.assertEqual(settings, FilterSettings({label: {SCENARIO_FILTER_TYPE: {"scenario_1": True}}}))
+        self.assertNotEqual(settings, FilterSettings({label: {SCENARIO_FILTER_TYPE: {"scenario_1": False}}}))
+        self.assertNotEqual(
+            settings, FilterSettings({label: {SCENARIO_FILTER_TYPE: {"scenario_1": True}}}, auto_online=False)
+        )
+        self.assertNotEqual(
+            settings,
+            FilterSettings(
+                {label: {SCENARIO_FILTER_TYPE: {"scenario_1": True}}},
+                enabled_filter_types={ALTERNATIVE_FILTER_TYPE: True, SCENARIO_FILTER_TYPE: True},
+            ),
+        )
+        self.assertNotEqual(settings, object())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,36 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Engine contributors
+# This file is part of Spine Engine.
+# Spine Engine is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+""" Unit tests for ``project_item_specification`` module. """
+import unittest
+from unittest import mock
+from spine_engine.project_item.project_item_specification import ProjectItemSpecification
+
+
+class TestProjectItemSpecification(unittest.TestCase):
+    def test_local_data_is_empty_without_local_entries(self):
+        specification = ProjectItemSpecification("spec")
+        with mock.patch.object(specification, "to_dict") as to_dict:
+            self.assertEqual(specification.local_data(), {})
+            to_dict.assert_not_called()
+
+    def test_local_data_gathers_local_entries(self):
+        specification = ProjectItemSpecification("spec")
+        with mock.patch.object(specification, "to_dict") as to_dict, mock.patch.object(
+            specification, "_definition_local_entries"
+        ) as local_entries:
+            to_dict.return_value = {"name": "spec", "settings": {"path": "/local/path", "shared": 5}}
+            local_entries.return_value = [("settings", "path")]
+            self.assertEqual(specification.local_data(), {"settings": {"path": "/local/path"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
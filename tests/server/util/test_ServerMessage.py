@@ -225,6 +225,33 @@ class TestServerMessage(unittest.TestCase):
         self.assertEqual(msg.getData(), {})
         self.assertEqual(len(msg.getFileNames()), 0)
 
+    def test_special_characters_in_command_id_and_file_names_survive_round_trip(self):
+        msg = ServerMessage('exe"cute', "4\\5", "{}", ['C:\\dir\\"quoted".zip'])
+        parsed_msg = ServerMessage.parse(msg.to_bytes())
+        self.assertEqual(parsed_msg.getCommand(), 'exe"cute')
+        self.assertEqual(parsed_msg.getId(), "4\\5")
+        self.assertEqual(parsed_msg.getFileNames(), ['C:\\dir\\"quoted".zip'])
+
+    def test_data_given_as_object_is_serialized(self):
+        engine_data = self.make_engine_data1()
+        msg = ServerMessage("start_execution", "1", engine_data, None)
+        parsed_msg = ServerMessage.parse(msg.to_bytes())
+        self.assertEqual(parsed_msg.getData(), engine_data)
+        reparsed_msg = ServerMessage.parse(parsed_msg.to_bytes())
+        self.assertEqual(reparsed_msg.getData(), engine_data)
+
+    def test_parsed_string_data_survives_round_trip(self):
+        msg = ServerMessage("prepare_execution", "1", json.dumps("my project"), ["p.zip"])
+        parsed_msg = ServerMessage.parse(msg.to_bytes())
+        self.assertEqual(parsed_msg.getData(), "my project")
+        reparsed_msg = ServerMessage.parse(parsed_msg.to_bytes())
+        self.assertEqual(reparsed_msg.getData(), "my project")
+        self.assertEqual(reparsed_msg.getFileNames(), ["p.zip"])
+
+    def test_empty_data_survives_round_trip(self):
+        parsed_msg = ServerMessage.parse(ServerMessage("ping", "1", "", None).to_bytes())
+        self.assertEqual(ServerMessage.parse(parsed_msg.to_bytes()).getData(), "")
+
 
 if __name__ == "__main__":
     unittest.main()
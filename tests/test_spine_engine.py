@@ -28,7 +28,7 @@ from spinedb_api.filters.scenario_filter import scenario_filter_config
 from spinedb_api.filters.execution_filter import execution_filter_config
 from spinedb_api.filters.tools import clear_filter_configs
 from spine_engine.exception import EngineInitFailed
-from spine_engine.spine_engine import validate_single_jump
+from spine_engine.spine_engine import _get_items_by_jump, validate_single_jump
 from spine_engine.utils.helpers import make_dag
 from spine_engine import ExecutionDirection, SpineEngine, SpineEngineState, ItemExecutionFinishState
 from spine_engine.project_item.connection import Jump, Connection
@@ -852,6 +852,43 @@ class TestValidateSingleJump(unittest.TestCase):
         except EngineInitFailed:
             self.fail("validate_single_jump shouldn't have raised")
 
+    def test_items_between_jump_ends_in_diamond(self):
+        edges = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": ["e"]}
+        dag = make_dag(edges)
+        jump = Jump("d", "top", "a", "top")
+        self.assertEqual(_get_items_by_jump([jump], dag), {jump: {"a", "b", "c", "d"}})
+        try:
+            validate_single_jump(jump, [jump], dag)
+        except EngineInitFailed:
+            self.fail("validate_single_jump shouldn't have raised")
+
+    def test_partially_overlapping_jumps_in_diamond_raise(self):
+        edges = {"a": ["b", "c"], "b": ["d"], "c": ["d"], "d": ["e"]}
+        dag = make_dag(edges)
+        jumps = [Jump("d", "top", "a", "top"), Jump("e", "top", "b", "top")]
+        items_by_jump = _get_items_by_jump(jumps, dag)
+        self.assertEqual(items_by_jump[jumps[1]], {"b", "d", "e"})
+        with self.assertRaises(EngineInitFailed):
+            validate_single_jump(jumps[0], jumps, dag, items_by_jump)
+
+    def test_self_jump(self):
+        edges = {"a": ["b"], "b": ["c"]}
+        dag = make_dag(edges)
+        jump = Jump("b", "top", "b", "bottom")
+        self.assertEqual(_get_items_by_jump([jump], dag), {jump: {"b"}})
+        try:
+            validate_single_jump(jump, [jump], dag)
+        except EngineInitFailed:
+            self.fail("validate_single_jump shouldn't have raised")
+
+    def test_jump_end_outside_dag(self):
+        edges = {"a": ["b"], "b": ["c"]}
+        dag = make_dag(edges)
+        jump = Jump("x", "top", "a", "top")
+        self.assertEqual(_get_items_by_jump([jump], dag), {jump: set()})
+        with self.assertRaises(EngineInitFailed):
+            validate_single_jump(jump, [jump], dag)
+
 
 if __name__ == "__main__":
     unittest.main()